@@ -2,18 +2,87 @@
 Main Flask application file with basic route structure.
 Handles HTTP requests, form processing, and database operations.
 """
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, jsonify
+from jinja2 import FileSystemBytecodeCache
+import orjson
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import threading
+
+# Validation limits and patterns, compiled once at import time
+_NAME_MAX_LEN = 100
+_EMAIL_MAX_LEN = 100
+_MESSAGE_MAX_LEN = 1000
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def configure_logging():
+    """Configure non-blocking logging for the application.
+
+    Request threads only enqueue log records via a QueueHandler; a
+    QueueListener on a background thread owns the real handlers and
+    performs the actual formatting and I/O.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    file_handler = logging.FileHandler('app.log')
+    file_handler.setFormatter(formatter)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+# Configure logging before importing modules that log
+configure_logging()
+logger = logging.getLogger(__name__)
+
 from database import db_manager, user_submission_repo, DatabaseConnectionError, DatabaseOperationError
 from config import get_config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+def configure_templates(app):
+    """Configure Jinja template caching for the application.
+
+    Disables template auto-reload outside debug mode (avoids a stat()
+    per render) and persists compiled template bytecode to disk so
+    renders after a worker restart skip the parse/compile step.
+    """
+    if not app.config.get('DEBUG', False):
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+        app.jinja_env.auto_reload = False
+
+    cache_dir = os.environ.get('JINJA_CACHE_DIR') or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), '.jinja_cache'
+    )
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    # FileSystemBytecodeCache executes whatever code objects it finds,
+    # so never load from a directory other users own or can write to
+    cache_stat = os.stat(cache_dir)
+    if cache_stat.st_uid != os.getuid() or cache_stat.st_mode & 0o077:
+        logger.warning(
+            f"Jinja bytecode cache disabled: {cache_dir} is not a private directory"
+        )
+        return
+
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
 
 # Initialize Flask application
 app = Flask(__name__)
@@ -21,13 +90,40 @@ app = Flask(__name__)
 # Load configuration
 config = get_config()
 app.config.from_object(config)
+configure_templates(app)
+
+# Database schema initialization is deferred to the first request so
+# worker processes boot without paying the connect + CREATE TABLE cost
+_db_init_lock = threading.Lock()
+_db_initialized = False
 
-# Initialize database on startup
-try:
-    db_manager.initialize_database()
-    logger.info("Application started successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize database: {e}")
+
+@app.before_request
+def ensure_database_initialized():
+    """Initialize database tables once per process, on first request."""
+    global _db_initialized
+    if _db_initialized:
+        return
+    with _db_init_lock:
+        if _db_initialized:
+            return
+        try:
+            db_manager.initialize_database()
+            logger.info("Database initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize database: {e}")
+        _db_initialized = True
+
+
+@functools.lru_cache(maxsize=32)
+def render_error_page(error: str) -> str:
+    """Render error.html for a fixed error message, cached per message.
+
+    The template's output depends only on the message, so the handful
+    of fixed error strings are rendered once and served from the cache
+    afterwards.
+    """
+    return render_template('error.html', error=error)
 
 
 @app.route('/', methods=['GET', 'POST'])
@@ -38,17 +134,19 @@ def index():
             return render_template('index.html')
         except Exception as e:
             logger.error(f"Error rendering index page: {e}")
-            return render_template('error.html', error="Failed to load the form page"), 500
+            return render_error_page("Failed to load the form page"), 500
     
     elif request.method == 'POST':
         return submit_form()
 def submit_form():
     """Handle form submission and store data in database."""
     try:
-        # Get form data
-        name = request.form.get('name', '').strip()
-        email = request.form.get('email', '').strip()
-        message = request.form.get('message', '').strip()
+        # Get form data (bind the MultiDict once instead of going
+        # through the request proxy per field)
+        form = request.form
+        name, email, message = (
+            form.get(field, '').strip() for field in ('name', 'email', 'message')
+        )
         
         # Validate form data
         validation_errors = validate_form_data(name, email, message)
@@ -94,15 +192,16 @@ def health_check():
         }
         
         status_code = 200 if is_db_healthy else 503
-        return jsonify(health_status), status_code
-        
+        return Response(orjson.dumps(health_status), status=status_code,
+                        mimetype='application/json')
+
     except Exception as e:
         logger.error(f"Health check failed: {e}")
-        return jsonify({
+        return Response(orjson.dumps({
             'status': 'unhealthy',
             'error': str(e),
             'database': 'error'
-        }), 503
+        }), status=503, mimetype='application/json')
 @app.route('/submissions')
 def view_submissions():
     """View all submissions (for debugging/admin purposes)."""
@@ -111,7 +210,8 @@ def view_submissions():
         if not app.config.get('DEBUG', False):
             return "Access denied", 403
         
-        submissions = user_submission_repo.get_all_submissions(limit=50)
+        # Stream rows into the template instead of buffering them all
+        submissions = user_submission_repo.iter_all_submissions(limit=50)
         return render_template('submissions.html', submissions=submissions)
         
     except Exception as e:
@@ -122,39 +222,37 @@ def view_submissions():
 @app.errorhandler(404)
 def not_found_error(error):
     """Handle 404 errors."""
-    return render_template('error.html', error="Page not found"), 404
+    return render_error_page("Page not found"), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors."""
     logger.error(f"Internal server error: {error}")
-    return render_template('error.html', error="Internal server error"), 500
+    return render_error_page("Internal server error"), 500
 
 
 def validate_form_data(name: str, email: str, message: str) -> list:
-    """Validate form input data."""
-    errors = []
-    
+    """Validate form input data, returning on the first error found."""
     # Validate name
     if not name:
-        errors.append("Name is required.")
-    elif len(name) > 100:
-        errors.append("Name must be less than 100 characters.")
-    
+        return ["Name is required."]
+    if len(name) > _NAME_MAX_LEN:
+        return ["Name must be less than 100 characters."]
+
     # Validate email
     if not email:
-        errors.append("Email is required.")
-    elif len(email) > 100:
-        errors.append("Email must be less than 100 characters.")
-    elif '@' not in email or '.' not in email.split('@')[-1]:
-        errors.append("Please enter a valid email address.")
-    
+        return ["Email is required."]
+    if len(email) > _EMAIL_MAX_LEN:
+        return ["Email must be less than 100 characters."]
+    if not _EMAIL_RE.match(email):
+        return ["Please enter a valid email address."]
+
     # Validate message (optional but with length limit)
-    if message and len(message) > 1000:
-        errors.append("Message must be less than 1000 characters.")
-    
-    return errors
+    if message and len(message) > _MESSAGE_MAX_LEN:
+        return ["Message must be less than 1000 characters."]
+
+    return []
 
 
 def create_app(config_name=None):
@@ -168,21 +266,11 @@ def create_app(config_name=None):
     # Validate production configuration
     if config_name == 'production':
         config_obj.validate()
-    
+
+    configure_templates(app)
+
     return app
 
 
-if __name__ == '__main__':
-    # Get configuration from environment
-    config_name = os.environ.get('FLASK_ENV', 'development')
-    port = int(os.environ.get('PORT', 5000))
-    host = os.environ.get('HOST', '0.0.0.0')
-    
-    logger.info(f"Starting Flask application in {config_name} mode on {host}:{port}")
-    
-    # Run the application
-    app.run(
-        host=host,
-        port=port,
-        debug=app.config.get('DEBUG', False)
-    )
+# Served by gunicorn in production (see gunicorn_conf.py):
+#     gunicorn -c gunicorn_conf.py app:app
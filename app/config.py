@@ -2,6 +2,7 @@
 Configuration module for database and application settings.
 Handles environment variables and database connection parameters.
 """
+import functools
 import os
 from typing import Optional
 
@@ -19,10 +20,18 @@ class Config:
     DB_NAME = os.environ.get('DB_NAME', 'webapp_db')
     DB_USER = os.environ.get('DB_USER', 'webappuser')
     DB_PASSWORD = os.environ.get('DB_PASSWORD', 'webapp_password')
+    # Optional Unix socket path for local MySQL; bypasses the TCP stack
+    DB_UNIX_SOCKET = os.environ.get('DB_UNIX_SOCKET', '')
     
     # Connection pool settings
     DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '5'))
     DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '3600'))
+
+    # Socket timeouts (seconds) so a stalled MySQL cannot hold a
+    # request greenlet indefinitely
+    DB_CONNECT_TIMEOUT = int(os.environ.get('DB_CONNECT_TIMEOUT', '10'))
+    DB_READ_TIMEOUT = int(os.environ.get('DB_READ_TIMEOUT', '30'))
+    DB_WRITE_TIMEOUT = int(os.environ.get('DB_WRITE_TIMEOUT', '30'))
     
     @classmethod
     def get_database_url(cls) -> str:
@@ -32,15 +41,21 @@ class Config:
     @classmethod
     def get_database_config(cls) -> dict:
         """Get database configuration as dictionary."""
-        return {
+        db_config = {
             'host': cls.DB_HOST,
             'port': cls.DB_PORT,
             'user': cls.DB_USER,
             'password': cls.DB_PASSWORD,
             'database': cls.DB_NAME,
             'charset': 'utf8mb4',
-            'autocommit': True
+            'autocommit': True,
+            'connect_timeout': cls.DB_CONNECT_TIMEOUT,
+            'read_timeout': cls.DB_READ_TIMEOUT,
+            'write_timeout': cls.DB_WRITE_TIMEOUT
         }
+        if cls.DB_UNIX_SOCKET:
+            db_config['unix_socket'] = cls.DB_UNIX_SOCKET
+        return db_config
 
 
 class DevelopmentConfig(Config):
@@ -72,9 +87,14 @@ config = {
 }
 
 
+@functools.cache
 def get_config(config_name: Optional[str] = None) -> Config:
-    """Get configuration object based on environment."""
+    """Get configuration object based on environment.
+
+    Cached per config name; environment variables are only consulted
+    on the first call.
+    """
     if config_name is None:
         config_name = os.environ.get('FLASK_ENV', 'default')
-    
+
     return config.get(config_name, config['default'])
@@ -2,14 +2,32 @@
 Database connection module using pymysql.
 Handles database connections, operations, and error handling.
 """
-import pymysql
 import logging
+import queue
+import threading
+import time
 from typing import Optional, Dict, Any, List
+from collections import namedtuple
+from concurrent.futures import Future
 from contextlib import contextmanager
+from dbutils.pooled_db import PooledDB
 from config import get_config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# pymysql is imported lazily on first connection so processes that
+# never touch the database skip the import cost
+pymysql = None
+
+
+def _load_pymysql():
+    """Import pymysql on first use and cache it at module level."""
+    global pymysql
+    if pymysql is None:
+        import pymysql as _pymysql
+        pymysql = _pymysql
+    return pymysql
+
+# Logging configuration belongs to the application entry point;
+# this module only emits through its named logger
 logger = logging.getLogger(__name__)
 
 
@@ -20,27 +38,46 @@ class DatabaseManager:
         """Initialize database manager with configuration."""
         self.config = config or get_config()
         self.connection_config = self.config.get_database_config()
-        self._connection = None
-    
-    def get_connection(self) -> pymysql.Connection:
-        """Get database connection with error handling."""
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """Create the connection pool on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = PooledDB(
+                        creator=_load_pymysql(),
+                        maxconnections=self.config.DB_POOL_SIZE,
+                        blocking=True,
+                        ping=1,
+                        **self.connection_config
+                    )
+        return self._pool
+
+    def get_connection(self):
+        """Check out a database connection from the pool."""
+        pymysql = _load_pymysql()
         try:
-            if self._connection is None or not self._connection.open:
-                self._connection = pymysql.connect(**self.connection_config)
-                logger.info("Database connection established")
-            return self._connection
+            return self._get_pool().connection()
         except pymysql.Error as e:
             logger.error(f"Database connection error: {e}")
             raise DatabaseConnectionError(f"Failed to connect to database: {e}")
-    
+
     @contextmanager
-    def get_cursor(self):
-        """Context manager for database cursor with automatic cleanup."""
+    def get_cursor(self, cursor_class=None):
+        """Context manager for database cursor with automatic cleanup.
+
+        Checks a connection out of the pool and returns it on exit so
+        concurrent requests never share a connection. Rows come back as
+        dicts by default; pass a pymysql cursor class for other row
+        shapes.
+        """
         connection = None
         cursor = None
         try:
             connection = self.get_connection()
-            cursor = connection.cursor(pymysql.cursors.DictCursor)
+            cursor = connection.cursor(cursor_class or pymysql.cursors.DictCursor)
             yield cursor
             connection.commit()
         except Exception as e:
@@ -51,17 +88,40 @@ class DatabaseManager:
         finally:
             if cursor:
                 cursor.close()
+            if connection:
+                connection.close()
     
-    def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
+    def execute_query(self, query: str, params: tuple = None, cursor_class=None) -> List[Any]:
         """Execute SELECT query and return results."""
         try:
-            with self.get_cursor() as cursor:
+            with self.get_cursor(cursor_class) as cursor:
                 cursor.execute(query, params)
                 return cursor.fetchall()
         except pymysql.Error as e:
             logger.error(f"Query execution error: {e}")
             raise DatabaseOperationError(f"Query execution failed: {e}")
     
+    def execute_query_streamed(self, query: str, params: tuple = None):
+        """Execute SELECT query, yielding rows without client-side buffering.
+
+        Uses an unbuffered (server-side) cursor so peak memory stays
+        constant regardless of result size. The yielded rows must be
+        fully consumed before the cursor's connection can return to the
+        pool.
+        """
+        pymysql = _load_pymysql()
+        try:
+            with self.get_cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(query, params)
+                while True:
+                    row = cursor.fetchone()
+                    if row is None:
+                        break
+                    yield row
+        except pymysql.Error as e:
+            logger.error(f"Query execution error: {e}")
+            raise DatabaseOperationError(f"Query execution failed: {e}")
+
     def execute_insert(self, query: str, params: tuple = None) -> int:
         """Execute INSERT query and return last insert ID."""
         try:
@@ -93,86 +153,222 @@ class DatabaseManager:
             logger.error(f"Connection test failed: {e}")
             return False
     
+    CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS user_submissions (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        email VARCHAR(100) NOT NULL,
+        message TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        INDEX idx_created_at_cov (created_at DESC, id, name, email),
+        INDEX idx_email (email)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """
+
     def initialize_database(self):
         """Initialize database with required tables."""
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS user_submissions (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            name VARCHAR(100) NOT NULL,
-            email VARCHAR(100) NOT NULL,
-            message TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            INDEX idx_created_at (created_at),
-            INDEX idx_email (email)
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-        """
-        
         try:
             with self.get_cursor() as cursor:
-                cursor.execute(create_table_query)
+                cursor.execute(self.CREATE_TABLE_SQL)
                 logger.info("Database tables initialized successfully")
         except pymysql.Error as e:
             logger.error(f"Database initialization error: {e}")
             raise DatabaseOperationError(f"Database initialization failed: {e}")
     
     def close_connection(self):
-        """Close database connection."""
-        if self._connection and self._connection.open:
-            self._connection.close()
-            logger.info("Database connection closed")
+        """Close all pooled database connections."""
+        if self._pool:
+            self._pool.close()
+            logger.info("Database connection pool closed")
+
+
+class _SubmissionWriteBatcher:
+    """Background writer that fuses pending INSERTs into batched transactions.
+
+    Callers enqueue their row parameters and receive a Future; a daemon
+    thread drains the queue and writes up to MAX_BATCH_ROWS rows per
+    transaction, so a burst of submissions costs one commit per batch
+    instead of one per row.
+    """
+
+    MAX_BATCH_ROWS = 256
+    FLUSH_WINDOW = 0.05  # seconds to wait for more rows after the first
+
+    def __init__(self, db_manager: DatabaseManager, insert_sql: str):
+        """Initialize batcher with database manager and INSERT template."""
+        self.db_manager = db_manager
+        self.insert_sql = insert_sql
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, params: tuple) -> Future:
+        """Enqueue one row for insertion; the Future resolves to its ID."""
+        self._ensure_thread()
+        future = Future()
+        self._queue.put((params, future))
+        return future
+
+    def _ensure_thread(self):
+        """Start the writer thread on first use (or after a crash)."""
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(
+                        target=self._run, name='submission-writer', daemon=True
+                    )
+                    self._thread.start()
+
+    def _run(self):
+        """Drain the queue, grouping rows that arrive close together."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.FLUSH_WINDOW
+            while len(batch) < self.MAX_BATCH_ROWS:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch):
+        """Write one batch in a single transaction and resolve its futures.
+
+        Rows are inserted individually so each future gets its row's
+        real lastrowid — a single multi-row INSERT is not guaranteed
+        consecutive auto-increment IDs under MySQL 8.0's default
+        innodb_autoinc_lock_mode=2 — but the batch still costs only
+        one commit.
+        """
+        connection = None
+        cursor = None
+        try:
+            connection = self.db_manager.get_connection()
+            connection.begin()
+            cursor = connection.cursor()
+            row_ids = []
+            for params, _ in batch:
+                cursor.execute(self.insert_sql, params)
+                row_ids.append(cursor.lastrowid)
+            connection.commit()
+        except pymysql.Error as e:
+            if connection:
+                connection.rollback()
+            logger.error(f"Batched insert operation error: {e}")
+            error = DatabaseOperationError(f"Insert operation failed: {e}")
+            for _, future in batch:
+                future.set_exception(error)
+        except Exception as e:
+            if connection:
+                connection.rollback()
+            logger.error(f"Batched insert failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), row_id in zip(batch, row_ids):
+                future.set_result(row_id)
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()
+
+
+# Lightweight row type for submission listings; attribute access keeps
+# the templates working while avoiding a dict allocation per row
+Submission = namedtuple('Submission', ['id', 'name', 'email', 'message', 'created_at'])
 
 
 class UserSubmissionRepository:
     """Repository class for user submission operations."""
-    
+
+    # Statement templates built once at class definition; pymysql has no
+    # server-side prepared statements, so keeping the SQL text constant
+    # at least lets MySQL reuse its parse of identical statements
+    INSERT_SUBMISSION_SQL = """
+    INSERT INTO user_submissions (name, email, message)
+    VALUES (%s, %s, %s)
+    """
+
+    SELECT_SUBMISSION_BY_ID_SQL = """
+    SELECT id, name, email, message, created_at
+    FROM user_submissions
+    WHERE id = %s
+    """
+
+    SELECT_ALL_SUBMISSIONS_SQL = """
+    SELECT id, name, email, message, created_at
+    FROM user_submissions
+    ORDER BY created_at DESC
+    LIMIT %s
+    """
+
     def __init__(self, db_manager: DatabaseManager):
         """Initialize repository with database manager."""
         self.db_manager = db_manager
-    
+        self._write_batcher = _SubmissionWriteBatcher(db_manager, self.INSERT_SUBMISSION_SQL)
+
     def create_submission(self, name: str, email: str, message: str) -> int:
-        """Create a new user submission."""
-        query = """
-        INSERT INTO user_submissions (name, email, message)
-        VALUES (%s, %s, %s)
+        """Create a new user submission.
+
+        The row is handed to the write batcher and this call waits for
+        its batch to commit, so callers still get a durable submission
+        ID back.
         """
         params = (name, email, message)
-        
+
         try:
-            submission_id = self.db_manager.execute_insert(query, params)
+            submission_id = self._write_batcher.submit(params).result()
             logger.info(f"User submission created with ID: {submission_id}")
             return submission_id
         except Exception as e:
             logger.error(f"Failed to create user submission: {e}")
             raise
-    
+
     def get_submission_by_id(self, submission_id: int) -> Optional[Dict[str, Any]]:
         """Get user submission by ID."""
-        query = """
-        SELECT id, name, email, message, created_at
-        FROM user_submissions
-        WHERE id = %s
-        """
         params = (submission_id,)
-        
+
         try:
-            results = self.db_manager.execute_query(query, params)
+            results = self.db_manager.execute_query(self.SELECT_SUBMISSION_BY_ID_SQL, params)
             return results[0] if results else None
         except Exception as e:
             logger.error(f"Failed to get user submission: {e}")
             raise
-    
-    def get_all_submissions(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all user submissions with optional limit."""
-        query = """
-        SELECT id, name, email, message, created_at
-        FROM user_submissions
-        ORDER BY created_at DESC
-        LIMIT %s
+
+    def get_all_submissions(self, limit: int = 100) -> List[Submission]:
+        """Get all user submissions with optional limit.
+
+        Uses a plain tuple cursor and wraps each row in the Submission
+        namedtuple instead of paying for a dict per row.
         """
         params = (limit,)
-        
+
+        try:
+            rows = self.db_manager.execute_query(
+                self.SELECT_ALL_SUBMISSIONS_SQL, params,
+                cursor_class=_load_pymysql().cursors.Cursor
+            )
+            return [Submission._make(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Failed to get user submissions: {e}")
+            raise
+
+    def iter_all_submissions(self, limit: int = 100):
+        """Iterate user submissions without buffering the result set.
+
+        Streams rows from the server one at a time, so memory stays
+        flat however large the limit is.
+        """
+        params = (limit,)
+
         try:
-            return self.db_manager.execute_query(query, params)
+            rows = self.db_manager.execute_query_streamed(self.SELECT_ALL_SUBMISSIONS_SQL, params)
+            for row in rows:
+                yield Submission._make(row)
         except Exception as e:
             logger.error(f"Failed to get user submissions: {e}")
             raise
@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for the Flask web application.
+Run with: gunicorn -c gunicorn_conf.py app:app
+"""
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '5000')}"
+
+# Pre-fork workers with gevent greenlets: pymysql calls cooperatively
+# yield while waiting on MySQL, so each worker can serve many
+# concurrent requests without blocking on database I/O.
+workers = int(os.environ.get('GUNICORN_WORKERS', 2 * multiprocessing.cpu_count() + 1))
+worker_class = 'gevent'
+worker_connections = 1000
+
+accesslog = '-'
+errorlog = '-'
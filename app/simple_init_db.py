@@ -4,6 +4,7 @@ Simple database initialization script.
 Creates the user_submissions table if it doesn't exist.
 """
 import os
+import random
 import sys
 import time
 import pymysql
@@ -22,75 +23,89 @@ def init_database():
         'user': os.environ.get('DB_USER', 'webappuser'),
         'password': os.environ.get('DB_PASSWORD', 'webapp_password'),
         'database': os.environ.get('DB_NAME', 'webapp_db'),
-        'charset': 'utf8mb4'
+        'charset': 'utf8mb4',
+        'connect_timeout': 2
     }
-    
+
     logger.info(f"Connecting to database: {db_config['host']}:{db_config['port']}")
     logger.info(f"Database: {db_config['database']}, User: {db_config['user']}")
-    
-    # Retry logic for database connection
+
+    # Retry logic for database connection: exponential backoff with
+    # jitter, capped at max_retry_delay seconds
     max_retries = 10
-    retry_delay = 30
+    max_retry_delay = 30
     
     for attempt in range(max_retries):
         try:
-            # Connect to database
-            connection = pymysql.connect(**db_config)
+            # Connect with multi-statement support so the whole
+            # initialization runs in a single network round-trip
+            connection = pymysql.connect(
+                **db_config,
+                client_flag=pymysql.constants.CLIENT.MULTI_STATEMENTS
+            )
             logger.info("Database connection successful!")
-            
-            # Create table
+
+            create_table_sql = """
+            CREATE TABLE IF NOT EXISTS user_submissions (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                email VARCHAR(100) NOT NULL,
+                message TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                INDEX idx_created_at_cov (created_at DESC, id, name, email),
+                INDEX idx_email (email)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+            """
+
             with connection.cursor() as cursor:
-                # Check MySQL version
-                cursor.execute("SELECT VERSION()")
-                version = cursor.fetchone()
-                logger.info(f"MySQL Version: {version[0]}")
-                
-                # Create table if not exists
-                create_table_sql = """
-                CREATE TABLE IF NOT EXISTS user_submissions (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    email VARCHAR(100) NOT NULL,
-                    message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_created_at (created_at),
-                    INDEX idx_email (email)
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
-                """
-                
-                cursor.execute(create_table_sql)
+                # Version check, table creation and verification as one
+                # batched statement; results are read via nextset()
+                cursor.execute(
+                    "SELECT VERSION(); "
+                    + create_table_sql + "; "
+                    "SHOW TABLES LIKE 'user_submissions'; "
+                    "DESCRIBE user_submissions"
+                )
+
+                result_sets = [cursor.fetchall() if cursor.description else None]
+                while cursor.nextset():
+                    result_sets.append(cursor.fetchall() if cursor.description else None)
                 connection.commit()
+
+                version_rows, _, table_rows, describe_rows = result_sets
+                logger.info(f"MySQL Version: {version_rows[0][0]}")
                 logger.info("Table 'user_submissions' created successfully!")
-                
-                # Verify table exists
-                cursor.execute("SHOW TABLES LIKE 'user_submissions'")
-                result = cursor.fetchone()
-                if result:
+
+                if table_rows:
                     logger.info("Table verification successful")
-                    # Show table structure
-                    cursor.execute("DESCRIBE user_submissions")
-                    columns = cursor.fetchall()
                     logger.info("Table structure:")
-                    for column in columns:
+                    for column in describe_rows:
                         logger.info(f"  {column[0]}: {column[1]}")
                 else:
                     logger.error("Table verification failed")
                     return False
-            
+
             connection.close()
             logger.info("Database initialization completed successfully!")
             return True
             
-        except Exception as e:
+        except pymysql.OperationalError as e:
             attempt_num = attempt + 1
             logger.error(f"Database connection attempt {attempt_num}/{max_retries} failed: {e}")
-            
+
             if attempt_num < max_retries:
-                logger.info(f"Waiting {retry_delay} seconds before retry...")
+                # Jitter spreads retries out so parallel workers don't
+                # hammer MySQL in lockstep
+                retry_delay = min(max_retry_delay, 2 ** attempt) * (0.5 + random.random())
+                logger.info(f"Waiting {retry_delay:.1f} seconds before retry...")
                 time.sleep(retry_delay)
             else:
                 logger.error("All database connection attempts failed!")
                 return False
+
+        except Exception as e:
+            logger.error(f"Database initialization failed: {e}")
+            return False
     
     return False
 